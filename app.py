@@ -2,17 +2,23 @@
 # Simplified v1 + directors column + safe CH error handling + master CSV merge (fixed uploader)
 # Focused on: older owners, long trading history, local radius, curated SICs.
 
+import io
 import math
 import urllib.parse as ul
-from typing import Dict, List
+from typing import Any, Dict, List, Tuple
 
+import numpy as np
 import pandas as pd
 import streamlit as st
 
 from ch_retirement_finder import (
+    SIC_GROUPS,
+    PostcodeLookupError,
     find_targets,
     filter_by_radius,
+    geocode_postcode,
     geocode_rows,
+    stale_responses,
 )
 
 # ---------------------------------------------------------------------------
@@ -58,24 +64,21 @@ section[data-testid="stSidebar"] .block-container {
     font-size: 0.95rem;
 }
 
-/* KPI cards */
-.kpi-row {
-    margin-bottom: 12px;
-}
-.kpi {
+/* KPI cards (st.metric) */
+[data-testid="stMetric"] {
     padding: 12px 16px;
     border-radius: 16px;
     background: #ffffff;
     border: 1px solid #e5e7eb;
     box-shadow: 0 8px 18px rgba(15, 23, 42, 0.03);
 }
-.kpi h3 {
+[data-testid="stMetricValue"] {
     margin: 2px 0 0 0;
     font-size: 1.4rem;
     line-height: 1.1;
     color: #0f172a;
 }
-.kpi small {
+[data-testid="stMetricLabel"] p {
     color: #6b7280;
     text-transform: uppercase;
     letter-spacing: 0.06em;
@@ -91,7 +94,8 @@ section[data-testid="stSidebar"] .block-container {
 }
 
 /* Buttons */
-.stButton button {
+.stButton button,
+.stFormSubmitButton button {
     border-radius: 999px;
     border: 1px solid #1d4ed8;
     background: #1d4ed8;
@@ -99,7 +103,8 @@ section[data-testid="stSidebar"] .block-container {
     padding: 0.4rem 1.2rem;
     font-weight: 500;
 }
-.stButton button:hover {
+.stButton button:hover,
+.stFormSubmitButton button:hover {
     background: #1e40af;
     border-color: #1e40af;
 }
@@ -119,51 +124,21 @@ st.markdown(
 )
 
 # ---------------------------------------------------------------------------
-# Session state for master CSV
+# Session state for master CSV + last search results
 # ---------------------------------------------------------------------------
 
 if "master_df" not in st.session_state:
     st.session_state.master_df = None
-
-# ---------------------------------------------------------------------------
-# Curated SIC groups (boring, stable, non-AI / physical work)
-# ---------------------------------------------------------------------------
-
-
-def sic_groups() -> Dict[str, List[str]]:
-    return {
-        "Fabrication & metalwork": [
-            "25110", "25120", "25290", "25610", "25620", "25990", "24540",
-        ],
-        "Machinery & engineering": [
-            "28220", "28290", "28410", "28490", "28990", "33120", "33140", "33200",
-        ],
-        "Plastics & packaging": [
-            "22210", "22220", "22230", "22290", "17230", "17290",
-        ],
-        "Electrical & components": [
-            "27120", "27900", "26511",
-        ],
-        "Industrial / trade supply": [
-            "46620", "46690", "46720", "46740", "46900", "46130", "46730",
-        ],
-        "Automotive parts & filters": [
-            "29320", "45310", "45320",
-        ],
-        "Joinery / wood products": [
-            "16230", "16240",
-        ],
-        "Other boring manufacturing": [
-            "20412", "20590", "32990", "38320",
-        ],
-    }
-
+if "results_rows" not in st.session_state:
+    st.session_state.results_rows = None
+    st.session_state.results_radius = 0.0
 
 # ---------------------------------------------------------------------------
 # Sidebar controls
 # ---------------------------------------------------------------------------
 
-with st.sidebar:
+# Filters live in a form so edits don't rerun the script until "Run search".
+with st.sidebar.form("filters"):
     st.header("Search filters")
 
     # Geography
@@ -177,11 +152,13 @@ with st.sidebar:
     min_years_trading = st.slider("Minimum years trading", 0, 40, 10)
 
     st.subheader("Industries (SIC groups)")
-    selected_sics: List[str] = []
-    for group_name, codes in sic_groups().items():
-        checked = st.checkbox(f"{group_name} ({', '.join(codes)})", value=True)
-        if checked:
-            selected_sics.extend(codes)
+    selected_groups = st.multiselect(
+        "SIC groups",
+        options=list(SIC_GROUPS),
+        default=list(SIC_GROUPS),
+        format_func=lambda g: f"{g} ({', '.join(SIC_GROUPS[g])})",
+    )
+    selected_sics: List[str] = [c for g in selected_groups for c in SIC_GROUPS[g]]
 
     st.subheader("Companies House results page")
     page_number = st.number_input(
@@ -193,7 +170,7 @@ with st.sidebar:
         help="Use this to move through the CH advanced search results.",
     )
 
-    run_search = st.button("Run search", use_container_width=True)
+    run_search = st.form_submit_button("Run search", use_container_width=True)
 
 # ---------------------------------------------------------------------------
 # Master CSV upload (always visible)
@@ -222,46 +199,306 @@ else:
 # Helper: scoring for prioritisation (0–100)
 # ---------------------------------------------------------------------------
 
+def compute_scores(df: pd.DataFrame, radius_used: float) -> np.ndarray:
+    """Expects numeric columns already typed (see build_frame)."""
+    n = len(df)
+
+    def num(col: str) -> np.ndarray:
+        if col not in df.columns:
+            return np.full(n, np.nan)
+        return df[col].to_numpy(dtype=float, na_value=np.nan)
+
+    def flag(col: str) -> np.ndarray:
+        if col not in df.columns:
+            return np.zeros(n, dtype=bool)
+        return df[col].to_numpy(dtype=bool)
 
-def compute_score_row(row, radius_used: float) -> float:
-    score = 0.0
+    score = np.zeros(n)
 
-    # Director age: reward 63–75
-    age = row.get("avg_director_age")
-    if isinstance(age, (int, float)):
-        if age >= 75:
-            score += 40
-        elif age >= 63:
-            score += 25 + (age - 63) * 1.2  # gentle ramp
+    # Director age: reward 63–75 (NaN compares False, so missing ages score 0)
+    age = num("avg_director_age")
+    score += np.where(age >= 75, 40.0, np.where(age >= 63, 25 + (age - 63) * 1.2, 0.0))
 
     # Years trading: reward 10–40
-    yrs = row.get("years_trading")
-    if isinstance(yrs, (int, float)):
-        if yrs >= 30:
-            score += 30
-        elif yrs >= 10:
-            score += 15 + (yrs - 10) * 0.75
+    yrs = num("years_trading")
+    score += np.where(yrs >= 30, 30.0, np.where(yrs >= 10, 15 + (yrs - 10) * 0.75, 0.0))
 
     # Distance: closer is better
-    dist = row.get("distance_km")
-    if isinstance(dist, (int, float)) and radius_used > 0:
-        if dist <= radius_used / 2:
-            score += 20
-        elif dist <= radius_used:
-            score += 10
+    if radius_used > 0:
+        dist = num("distance_km")
+        score += np.where(dist <= radius_used / 2, 20.0, np.where(dist <= radius_used, 10.0, 0.0))
 
     # Filings freshness (accounts & confirmation)
-    if not row.get("accounts_overdue") and not row.get("confirmation_overdue"):
-        score += 10
+    score += np.where(flag("accounts_overdue") | flag("confirmation_overdue"), 0.0, 10.0)
+
+    # Python's round, not ndarray.round: the latter scales by 10 first and can
+    # land on the other side of a .x5 tie, shifting displayed scores by 0.1
+    capped = np.minimum(score, 100.0)
+    return np.fromiter((round(s, 1) for s in capped.tolist()), dtype=float, count=n)
+
+
+# ---------------------------------------------------------------------------
+# Cached search wrappers (identical filters skip Companies House / postcodes.io)
+# ---------------------------------------------------------------------------
+
+
+@st.cache_data(ttl=3600, max_entries=32, show_spinner=False)
+def cached_find_targets(
+    sic_codes: Tuple[str, ...],
+    min_age: int,
+    max_directors: int,
+    min_years_trading: int,
+    size: int,
+    start_page: int,
+    max_companies: int,
+    centre_postcode: str,
+    radius_km: float,
+) -> List[Dict[str, Any]]:
+    return find_targets(
+        list(sic_codes),
+        min_age=min_age,
+        max_directors=max_directors,
+        min_years_trading=min_years_trading,
+        size=size,
+        start_page=start_page,
+        max_companies=max_companies,
+        centre_postcode=centre_postcode,
+        radius_km=radius_km,
+    )
+
+
+@st.cache_data(ttl=3600, max_entries=32, show_spinner=False)
+def cached_filter_by_radius(rows: List[Dict[str, Any]], centre_postcode: str, radius: float) -> List[Dict[str, Any]]:
+    return filter_by_radius(rows, centre_postcode, radius)
+
+
+@st.cache_data(ttl=3600, max_entries=32, show_spinner=False)
+def cached_geocode_rows(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return geocode_rows(rows)
+
+
+def frame_to_csv(df: pd.DataFrame) -> bytes:
+    # Write straight to a bytes buffer rather than building a str and encoding a copy
+    buf = io.BytesIO()
+    df.to_csv(buf, index=False, encoding="utf-8")
+    return buf.getvalue()
+
+
+# st.cache_data hashes the frame's content, so unchanged exports skip to_csv on reruns.
+# Only for small frames: past 50k rows Streamlit hashes a 10k-row sample, so two
+# different frames can share a key. The merged master goes through frame_to_csv.
+@st.cache_data(max_entries=8, show_spinner=False)
+def csv_bytes(df: pd.DataFrame) -> bytes:
+    return frame_to_csv(df)
+
+
+# ---------------------------------------------------------------------------
+# Results (fragment: download clicks rerun only this block)
+# ---------------------------------------------------------------------------
+
+
+# Outreach email: fixed text around the per-company name and CH link
+EMAIL_SUBJECT_PREFIX = "Succession / exit option for "
+EMAIL_BODY_PREFIX = (
+    "Hi,\n\nI run an acquisition company focused on long-established, well-run firms "
+    "where the owner is considering retirement. Would you be open to a confidential chat?\n\n"
+    "Companies House profile: "
+)
+EMAIL_BODY_SUFFIX = "\n\nBest regards,\n"
+
+# ul.quote works character by character, so the fixed template text can be quoted
+# once here and only the per-company pieces need quoting on each run.
+_EMAIL_SUBJECT_PREFIX_Q = ul.quote(EMAIL_SUBJECT_PREFIX)
+_EMAIL_BODY_PREFIX_Q = ul.quote(EMAIL_BODY_PREFIX)
+_EMAIL_BODY_SUFFIX_Q = ul.quote(EMAIL_BODY_SUFFIX)
+
+# ASCII unit separator: quotes to a fixed token, so a whole column can be quoted in one call
+_QUOTE_SEP = "\x1f"
+_QUOTE_SEP_QUOTED = ul.quote(_QUOTE_SEP)
+
+
+def quote_column(values: pd.Series) -> pd.Series:
+    if values.empty:
+        return values
+    joined = _QUOTE_SEP.join(values.str.replace(_QUOTE_SEP, "", regex=False))
+    return pd.Series(ul.quote(joined).split(_QUOTE_SEP_QUOTED), index=values.index)
+
+
+# Columns to show (includes active_directors)
+VIEW_COLS = [
+    "score",
+    "company_name",
+    "company_number",
+    "years_trading",
+    "avg_director_age",
+    "active_directors",
+    "director_ages",
+    "postcode",
+    "distance_km",
+    "last_accounts_made_up_to",
+    "months_since_accounts",
+    "accounts_overdue",
+    "confirmation_last_made_up_to",
+    "months_since_confirmation",
+    "confirmation_overdue",
+    "sic_codes",
+    "ch_link",
+    "google",
+    "email_link",
+]
+# Default table view; the full VIEW_COLS set is one checkbox away and always exported
+PRIMARY_COLS = [
+    "score",
+    "company_name",
+    "company_number",
+    "years_trading",
+    "avg_director_age",
+    "active_directors",
+    "postcode",
+    "distance_km",
+    "ch_link",
+    "email_link",
+]
+DERIVED_COLS = {"score", "email_subject", "email_body", "email_link"}
+
+# Typed columns for the results frame; None becomes NaN / <NA>. Counts stay
+# integers (nullable Int64) so the CSV export keeps writing "12", not "12.0".
+FLOAT_COLS = ("avg_director_age", "distance_km", "lat", "lon")
+INT_COLS = ("years_trading", "active_directors", "months_since_accounts", "months_since_confirmation")
+BOOL_COLS = (
+    "accounts_overdue",
+    "confirmation_overdue",
+    "has_insolvency_history",
+    "undeliverable_registered_office_address",
+    "registered_office_is_in_dispute",
+)
+# Text columns are Arrow-backed so st.dataframe ships them without a per-cell conversion
+TEXT_COLS = (
+    "company_number",
+    "company_name",
+    "incorporated",
+    "sic_codes",
+    "director_ages",
+    "postcode",
+    "last_accounts_made_up_to",
+    "confirmation_last_made_up_to",
+    "ch_link",
+    "google",
+)
+
+
+def build_frame(rows: List[Dict[str, Any]]) -> pd.DataFrame:
+    # Row dicts -> one typed array per column, including any view column the rows lack
+    cols = list(dict.fromkeys([*rows[0], *(c for c in VIEW_COLS if c not in DERIVED_COLS)]))
+    data: Dict[str, Any] = {}
+    for c in cols:
+        values = [r.get(c) for r in rows]
+        if c in FLOAT_COLS:
+            data[c] = np.array(values, dtype=np.float64)
+        elif c in INT_COLS:
+            data[c] = pd.array(values, dtype="Int64")
+        elif c in BOOL_COLS:
+            data[c] = np.array([bool(v) for v in values], dtype=bool)
+        elif c in TEXT_COLS:
+            data[c] = pd.array(values, dtype="string[pyarrow]")
+        else:
+            data[c] = values
+    return pd.DataFrame(data)
+
+
+@st.fragment
+def render_results(rows: List[Dict[str, Any]], radius_used: float) -> None:
+    df = build_frame(rows)
+
+    # Outreach links
+    names = df["company_name"].fillna("").astype(str)
+    ch_links = df["ch_link"].fillna("").astype(str)
+    email_subjects = EMAIL_SUBJECT_PREFIX + names
+    email_bodies = EMAIL_BODY_PREFIX + ch_links + EMAIL_BODY_SUFFIX
+
+    # Score + outreach columns added in a single assign
+    df = df.assign(
+        score=compute_scores(df, radius_used),
+        email_subject=email_subjects,
+        email_body=email_bodies,
+        email_link=(
+            "mailto:?subject=" + _EMAIL_SUBJECT_PREFIX_Q + quote_column(names)
+            + "&body=" + _EMAIL_BODY_PREFIX_Q + quote_column(ch_links) + _EMAIL_BODY_SUFFIX_Q
+        ),
+    )
 
-    return round(min(score, 100.0), 1)
+    # Basic KPIs: NaN-aware means straight on the float arrays (0 when a column is all missing)
+    means: Dict[str, float] = {}
+    for col in ("score", "years_trading", "avg_director_age"):
+        arr = df[col].to_numpy(dtype=np.float64, na_value=np.nan)
+        means[col] = float(np.nanmean(arr)) if not np.isnan(arr).all() else 0.0
+    c1, c2, c3, c4 = st.columns(4)
+    c1.metric("Results", f"{len(df):,}")
+    c2.metric("Avg score", f"{means['score']:.1f}")
+    c3.metric("Avg years", f"{means['years_trading']:.1f}")
+    c4.metric("Avg dir age", f"{means['avg_director_age']:.1f}")
+
+    # Sort once on the score array and project the export columns once;
+    # the table reuses that frame minus the heavy email text columns.
+    order = np.argsort(-df["score"].to_numpy(), kind="stable")
+    export_df = df.iloc[order][VIEW_COLS + ["email_subject", "email_body"]]
+
+    st.subheader("Results")
+    show_all_cols = st.checkbox("Show all columns", value=False)
+    # export_df is already score-ordered, so the top N is a head(); CSVs keep every row
+    top_n = len(export_df)
+    if top_n > 10:
+        top_n = st.slider("Show top N by score", 10, top_n, min(50, top_n))
+    view_cols = VIEW_COLS if show_all_cols else PRIMARY_COLS
+    st.dataframe(export_df.head(top_n)[view_cols], use_container_width=True)
+
+    # ----------------------------
+    # Export & master CSV merge
+    # ----------------------------
+    st.subheader("Export")
+
+    # Download just this run's results
+    st.download_button(
+        "Download this run's results CSV",
+        data=csv_bytes(export_df),
+        file_name="boomer_radar_results.csv",
+        mime="text/csv",
+        use_container_width=True,
+    )
+
+    # If a master CSV is loaded in session, offer merged export
+    if st.session_state.master_df is not None:
+        merged = pd.concat(
+            [st.session_state.master_df, export_df],
+            ignore_index=True,
+        )
+
+        if "company_number" in merged.columns:
+            merged = merged.drop_duplicates(subset="company_number")
+        else:
+            merged = merged.drop_duplicates()
+
+        st.download_button(
+            "Download UPDATED master CSV (merged + de-duplicated)",
+            data=frame_to_csv(merged),
+            file_name="boomer_radar_master.csv",
+            mime="text/csv",
+            use_container_width=True,
+        )
+    else:
+        st.caption(
+            "Upload a master CSV above if you want to auto-merge these results into your long-term list."
+        )
 
 
 # ---------------------------------------------------------------------------
-# Main search + results
+# Main search
 # ---------------------------------------------------------------------------
 
 if run_search:
+    # A new search replaces whatever the last one left in session state
+    st.session_state.results_rows = None
+
     if not selected_sics:
         st.warning("Please keep at least one SIC group selected.")
     else:
@@ -269,16 +506,34 @@ if run_search:
         # Call Companies House safely
         # -----------------------------
         with st.spinner("Querying Companies House…"):
+            search_args = dict(
+                # Sorted + de-duplicated so the cache key doesn't depend on group order
+                sic_codes=tuple(sorted(set(selected_sics))),
+                min_age=int(min_age),
+                max_directors=int(max_directors),
+                min_years_trading=int(min_years_trading),
+                size=100,
+                start_page=int(page_number),
+                max_companies=200,
+                # Lets find_targets skip far-away hits before fetching their officers
+                centre_postcode=centre_pc.strip(),
+                radius_km=float(radius_km) if centre_pc.strip() else 0.0,
+            )
+            stale_before = stale_responses()
             try:
-                rows = find_targets(
-                    selected_sics,
-                    min_age=int(min_age),
-                    max_directors=int(max_directors),
-                    min_years_trading=int(min_years_trading),
-                    size=100,
-                    start_page=int(page_number),
-                    max_companies=200,
-                )
+                rows = cached_find_targets(**search_args)
+                # Process-wide counter, so a concurrent session's outage can also trip this
+                if stale_responses() != stale_before:
+                    # Don't pin old data for the cache TTL; the next run retries the API
+                    cached_find_targets.clear(**search_args)
+                    st.warning(
+                        "Companies House couldn't be reached for part of this search, "
+                        "so some results come from an older cached copy."
+                    )
+            except PostcodeLookupError:
+                # Raised, not returned as [], so cached_find_targets doesn't keep it
+                st.warning("Couldn't reach postcodes.io to locate your postcode. Please try again in a moment.")
+                rows = None
             except Exception:
                 st.warning(
                     "Companies House didn't return results for this SIC + page + filter combination. "
@@ -286,7 +541,27 @@ if run_search:
                 )
                 rows = []
 
-        if not rows:
+        if rows is None:
+            pass  # postcodes.io unreachable; already warned above
+        elif not rows and centre_pc.strip():
+            # find_targets pre-screens hits by radius and returns nothing for an
+            # unknown centre postcode, so an empty result may be down to either
+            try:
+                centre_known = geocode_postcode(centre_pc)[0] is not None
+            except PostcodeLookupError:
+                centre_known = True  # can't tell, so don't blame the postcode
+            if not centre_known:
+                st.info(
+                    f"Postcode {centre_pc.strip().upper()} wasn't recognised. "
+                    "Check it, or clear it to search without a radius."
+                )
+            else:
+                st.info(
+                    "No companies matched your filters within this radius on this page.\n\n"
+                    "Try increasing the radius (e.g. 40–50km) or temporarily clearing the postcode, "
+                    "or try lowering director age, reducing years trading, or a different page."
+                )
+        elif not rows:
             st.info(
                 "No companies matched your filters on this page. "
                 "Try lowering director age, reducing years trading, widening radius, or trying a different page."
@@ -295,143 +570,24 @@ if run_search:
             # Radius filtering / geocoding
             if centre_pc.strip():
                 with st.spinner("Filtering by radius…"):
-                    rows = filter_by_radius(rows, centre_pc.strip(), float(radius_km))
+                    try:
+                        rows = cached_filter_by_radius(rows, centre_pc.strip(), float(radius_km))
+                    except PostcodeLookupError:
+                        st.warning("Couldn't reach postcodes.io to locate your postcode. Please try again in a moment.")
+                        rows = None
             else:
-                rows = geocode_rows(rows)
+                rows = cached_geocode_rows(rows)
 
-            if not rows:
+            if rows:
+                st.session_state.results_rows = rows
+                st.session_state.results_radius = float(radius_km)
+            elif rows is not None:  # None: the lookup failed and we've already warned
                 st.info(
                     "Companies were found on Companies House, but none within this radius.\n\n"
                     "Try increasing the radius (e.g. 40–50km) or temporarily clearing the postcode."
                 )
-            else:
-                df = pd.DataFrame(rows)
-
-                # Compute score
-                df["score"] = df.apply(lambda r: compute_score_row(r, float(radius_km)), axis=1)
 
-                # Basic KPIs
-                c1, c2, c3, c4 = st.columns(4)
-                with c1:
-                    st.markdown(
-                        f'<div class="kpi"><small>RESULTS</small><h3>{len(df):,}</h3></div>',
-                        unsafe_allow_html=True,
-                    )
-                with c2:
-                    avg_score = df["score"].mean() if not df.empty else 0
-                    st.markdown(
-                        f'<div class="kpi"><small>AVG SCORE</small><h3>{avg_score:.1f}</h3></div>',
-                        unsafe_allow_html=True,
-                    )
-                with c3:
-                    avg_years = df["years_trading"].mean() if "years_trading" in df.columns else 0
-                    st.markdown(
-                        f'<div class="kpi"><small>AVG YEARS</small><h3>{avg_years:.1f}</h3></div>',
-                        unsafe_allow_html=True,
-                    )
-                with c4:
-                    avg_age = df["avg_director_age"].mean() if "avg_director_age" in df.columns else 0
-                    st.markdown(
-                        f'<div class="kpi"><small>AVG DIR AGE</small><h3>{avg_age:.1f}</h3></div>',
-                        unsafe_allow_html=True,
-                    )
-
-                # Outreach links
-                email_subjects, email_bodies, email_links = [], [], []
-                for _, r in df.iterrows():
-                    ch_link = r.get("ch_link", "")
-                    company_name = r.get("company_name", "")
-                    subj = f"Succession / exit option for {company_name}"
-                    body = (
-                        f"Hi,\n\nI run an acquisition company focused on long-established, well-run firms "
-                        f"where the owner is considering retirement. Would you be open to a confidential chat?\n\n"
-                        f"Companies House profile: {ch_link}\n\n"
-                        f"Best regards,\n"
-                    )
-                    email_subjects.append(subj)
-                    email_bodies.append(body)
-                    email_links.append(
-                        "mailto:?subject=" + ul.quote(subj) + "&body=" + ul.quote(body)
-                    )
-
-                df["email_subject"] = email_subjects
-                df["email_body"] = email_bodies
-                df["email_link"] = email_links
-
-                # Columns to show (includes active_directors)
-                view_cols = [
-                    "score",
-                    "company_name",
-                    "company_number",
-                    "years_trading",
-                    "avg_director_age",
-                    "active_directors",
-                    "director_ages",
-                    "postcode",
-                    "distance_km",
-                    "last_accounts_made_up_to",
-                    "months_since_accounts",
-                    "accounts_overdue",
-                    "confirmation_last_made_up_to",
-                    "months_since_confirmation",
-                    "confirmation_overdue",
-                    "sic_codes",
-                    "ch_link",
-                    "google",
-                    "email_link",
-                ]
-                for c in view_cols:
-                    if c not in df.columns:
-                        df[c] = None
-
-                st.subheader("Results")
-                st.dataframe(
-                    df[view_cols].sort_values("score", ascending=False),
-                    use_container_width=True,
-                )
-
-                # ----------------------------
-                # Export & master CSV merge
-                # ----------------------------
-                st.subheader("Export")
-
-                # Download just this run's results
-                this_run_csv = df[view_cols + ["email_subject", "email_body"]].to_csv(index=False)
-                st.download_button(
-                    "Download this run's results CSV",
-                    data=this_run_csv,
-                    file_name="boomer_radar_results.csv",
-                    mime="text/csv",
-                    use_container_width=True,
-                )
-
-                # If a master CSV is loaded in session, offer merged export
-                if st.session_state.master_df is not None:
-                    new_df = df[view_cols + ["email_subject", "email_body"]]
-
-                    merged = pd.concat(
-                        [st.session_state.master_df, new_df],
-                        ignore_index=True,
-                    )
-
-                    if "company_number" in merged.columns:
-                        merged = merged.drop_duplicates(subset="company_number")
-                    else:
-                        merged = merged.drop_duplicates()
-
-                    merged_csv = merged.to_csv(index=False)
-
-                    st.download_button(
-                        "Download UPDATED master CSV (merged + de-duplicated)",
-                        data=merged_csv,
-                        file_name="boomer_radar_master.csv",
-                        mime="text/csv",
-                        use_container_width=True,
-                    )
-                else:
-                    st.caption(
-                        "Upload a master CSV above if you want to auto-merge these results into your long-term list."
-                    )
-
-else:
+if st.session_state.results_rows:
+    render_results(st.session_state.results_rows, st.session_state.results_radius)
+elif not run_search:
     st.info("Set your filters in the sidebar and click **Run search** to begin.")
@@ -3,14 +3,26 @@
 
 import base64
 import datetime as dt
+import json
 import math
 import os
+import sqlite3
+import threading
 import time
-from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
 from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import quote_plus
 
+import numpy as np
 import requests
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
+
+try:
+    import orjson  # type: ignore
+except Exception:
+    orjson = None  # type: ignore
 
 # ---------------------------------------------------------------------------
 # API key
@@ -39,8 +51,48 @@ def _cache_data(**kwargs):
 
 API_BASE = "https://api.company-information.service.gov.uk"
 
+_MAX_WORKERS = 8  # concurrent company lookups in find_targets
+
 SESSION = requests.Session()
 SESSION.headers.update({"User-Agent": "CH-Boomer-Radar/1.0.0"})
+# SESSION is shared by every Streamlit session in the process, so two concurrent
+# searches can have 2 * _MAX_WORKERS requests in flight. Size the per-host pool for
+# that (never below requests' default of 10) so finished sockets are kept alive
+# rather than discarded.
+SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=max(2 * _MAX_WORKERS, DEFAULT_POOLSIZE)))
+
+# ---------------------------------------------------------------------------
+# Curated SIC groups (boring, stable, non-AI / physical work)
+# ---------------------------------------------------------------------------
+
+# Module-level so it is built once per process, not on every Streamlit rerun.
+SIC_GROUPS: Dict[str, List[str]] = {
+    "Fabrication & metalwork": [
+        "25110", "25120", "25290", "25610", "25620", "25990", "24540",
+    ],
+    "Machinery & engineering": [
+        "28220", "28290", "28410", "28490", "28990", "33120", "33140", "33200",
+    ],
+    "Plastics & packaging": [
+        "22210", "22220", "22230", "22290", "17230", "17290",
+    ],
+    "Electrical & components": [
+        "27120", "27900", "26511",
+    ],
+    "Industrial / trade supply": [
+        "46620", "46690", "46720", "46740", "46900", "46130", "46730",
+    ],
+    "Automotive parts & filters": [
+        "29320", "45310", "45320",
+    ],
+    "Joinery / wood products": [
+        "16230", "16240",
+    ],
+    "Other boring manufacturing": [
+        "20412", "20590", "32990", "38320",
+    ],
+}
+
 
 # ---------------------------------------------------------------------------
 # Throttling
@@ -48,51 +100,204 @@ SESSION.headers.update({"User-Agent": "CH-Boomer-Radar/1.0.0"})
 
 _WINDOW = 300.0  # seconds
 _LIMIT = 580
-_REQ_TIMES: deque = deque()
+# Token bucket: a burst of _BURST, then a steady refill of _LIMIT per window, the same
+# sustained rate as a sliding window. A full burst plus refill could overshoot one CH
+# window, so _sync_rate_limit (CH's own remaining count) is the hard limit.
+_BURST = _LIMIT
+_RATE = _LIMIT / _WINDOW  # tokens per second
+_tokens = float(_BURST)
+_last_refill = time.monotonic()
+_paused_until = 0.0  # monotonic; set when CH says its own window is spent
+_RATE_RESERVE = 2  # pause once CH reports this few calls left
+_REQ_LOCK = threading.Lock()
+
+_RETRY_STATUS = (429, 500, 502, 503, 504)
+_MAX_ATTEMPTS = 4
+_BACKOFF = 2.5  # seconds, doubled per attempt when there's no Retry-After
 
 
 def _throttle():
-    now = time.time()
-    while _REQ_TIMES and now - _REQ_TIMES[0] > _WINDOW:
-        _REQ_TIMES.popleft()
-    if len(_REQ_TIMES) >= _LIMIT:
-        sleep_for = _WINDOW - (now - _REQ_TIMES[0]) + 1
-        time.sleep(max(1.0, sleep_for))
-    _REQ_TIMES.append(time.time())
+    global _tokens, _last_refill
+    while True:
+        with _REQ_LOCK:
+            now = time.monotonic()
+            if now < _paused_until:
+                wait = _paused_until - now
+            else:
+                _tokens = min(float(_BURST), _tokens + (now - _last_refill) * _RATE)
+                _last_refill = now
+                if _tokens >= 1.0:
+                    _tokens -= 1.0
+                    return
+                wait = (1.0 - _tokens) / _RATE
+        # Sleep outside the lock so other workers can re-check the bucket
+        time.sleep(wait)
+
+
+def _sync_rate_limit(resp: requests.Response) -> None:
+    # CH reports what is left of its window on every response. Trust that over the
+    # local estimate, since the key may be shared with other processes.
+    global _tokens, _paused_until
+    try:
+        remain = int(resp.headers["X-Ratelimit-Remain"])
+        reset_at = float(resp.headers["X-Ratelimit-Reset"])  # epoch seconds
+    except (KeyError, ValueError):
+        return
+    with _REQ_LOCK:
+        _tokens = min(_tokens, float(remain))
+        if remain <= _RATE_RESERVE:
+            resume = time.monotonic() + max(0.0, reset_at - time.time())
+            _paused_until = max(_paused_until, resume)
+
+
+def _retry_delay(resp: requests.Response, attempt: int) -> float:
+    try:
+        return max(0.0, float(resp.headers["Retry-After"]))
+    except (KeyError, ValueError):
+        return _BACKOFF * (2 ** attempt)
+
 
+# Built once at import. Merged per request rather than set on SESSION, because the
+# same session also calls postcodes.io, which must not see the API key.
+_AUTH_HEADER: Dict[str, str] = {
+    "Authorization": "Basic " + base64.b64encode(f"{API_KEY}:".encode()).decode(),
+}
 
-def _auth_header() -> Dict[str, str]:
-    token = base64.b64encode(f"{API_KEY}:".encode()).decode()
-    return {"Authorization": f"Basic {token}"}
+
+def _json_loads(raw: Any) -> Any:
+    # orjson when installed (faster, decodes bytes directly); stdlib json otherwise
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
 
 
 def _request(method: str, url: str, **kwargs) -> requests.Response:
-    headers = kwargs.pop("headers", {})
-    headers.update(_auth_header())
-    _throttle()
-    resp = SESSION.request(method, url, headers=headers, timeout=30, **kwargs)
-    if resp.status_code in (429, 500, 502, 503, 504):
-        retry_after = int(resp.headers.get("Retry-After", "5"))
-        time.sleep(retry_after)
+    headers = {**kwargs.pop("headers", {}), **_AUTH_HEADER}
+    for attempt in range(_MAX_ATTEMPTS):
         _throttle()
         resp = SESSION.request(method, url, headers=headers, timeout=30, **kwargs)
+        _sync_rate_limit(resp)
+        if resp.status_code not in _RETRY_STATUS or attempt == _MAX_ATTEMPTS - 1:
+            break
+        time.sleep(_retry_delay(resp, attempt))
     resp.raise_for_status()
     return resp
 
 
+# ---------------------------------------------------------------------------
+# On-disk cache
+# ---------------------------------------------------------------------------
+
+# Second tier under st.cache_data: survives restarts and is shared by every
+# process pointed at the same file.
+
+_CACHE_PATH = os.getenv("CH_CACHE_PATH", ".ch_cache.sqlite3")
+_DISK_TTL = 3600.0  # seconds; default, used for advanced-search pages
+_PROFILE_TTL = 86400.0  # filing dates / risk flags change at most daily
+_OFFICERS_TTL = 7 * 86400.0  # appointments and resignations are rare
+# Hard age limit, pruned on connect. Well past every TTL so stale-if-error
+# still has copies to fall back on, but the file no longer grows forever.
+_DISK_MAX_AGE = 4 * _OFFICERS_TTL
+_DB_LOCK = threading.Lock()
+_DB: Optional[sqlite3.Connection] = None
+
+
+def _db() -> Optional[sqlite3.Connection]:
+    global _DB
+    with _DB_LOCK:
+        if _DB is None:
+            try:
+                conn = sqlite3.connect(_CACHE_PATH, timeout=5, check_same_thread=False)
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS ch_cache "
+                    "(key TEXT PRIMARY KEY, stored_at REAL NOT NULL, body TEXT NOT NULL)"
+                )
+                conn.execute("CREATE TABLE IF NOT EXISTS postcodes (postcode TEXT PRIMARY KEY, lat REAL, lon REAL)")
+                # Freed pages are reused by later inserts, so no VACUUM needed
+                conn.execute("DELETE FROM ch_cache WHERE stored_at < ?", (time.time() - _DISK_MAX_AGE,))
+                conn.commit()
+                _DB = conn
+            except sqlite3.Error:
+                return None  # read-only disk etc.: run without the disk tier
+        return _DB
+
+
+def _disk_get(key: str, ttl: Optional[float]) -> Optional[Any]:
+    """Cached body for key, or None if missing / older than ttl (ttl=None: any age)."""
+    conn = _db()
+    if conn is None:
+        return None
+    try:
+        with _DB_LOCK:
+            row = conn.execute("SELECT stored_at, body FROM ch_cache WHERE key = ?", (key,)).fetchone()
+    except sqlite3.Error:
+        return None
+    # Wall clock, not monotonic: entries outlive the process
+    if row is None or (ttl is not None and time.time() - row[0] > ttl):
+        return None
+    return _json_loads(row[1])
+
+
+def _disk_ttl(path: str) -> float:
+    if path.startswith("/company/"):
+        return _OFFICERS_TTL if path.endswith("/officers") else _PROFILE_TTL
+    return _DISK_TTL
+
+
+def _disk_put(key: str, value: Any) -> None:
+    conn = _db()
+    if conn is None:
+        return
+    try:
+        with _DB_LOCK:
+            conn.execute(
+                "INSERT OR REPLACE INTO ch_cache (key, stored_at, body) VALUES (?, ?, ?)",
+                (key, time.time(), json.dumps(value)),
+            )
+            conn.commit()
+    except sqlite3.Error:
+        pass
+
+
+_STALE_LOCK = threading.Lock()
+_stale_served = 0
+
+
+def stale_responses() -> int:
+    """How many responses so far were served from an expired disk copy."""
+    with _STALE_LOCK:
+        return _stale_served
+
+
 @_cache_data(ttl=3600, show_spinner=False)
 def _ch_get_cached(path: str, params_key: Tuple[Tuple[str, Any], ...]) -> Dict[str, Any]:
+    key = json.dumps([path, params_key])
+    cached = _disk_get(key, _disk_ttl(path))
+    if cached is not None:
+        return cached
+
     url = f"{API_BASE}{path}"
     params = dict(params_key)
     resp = _request("GET", url, params=params)
-    if resp.status_code == 204:
-        return {}
-    return resp.json()
+    data = {} if resp.status_code == 204 else _json_loads(resp.content)
+    _disk_put(key, data)
+    return data
 
 
 def ch_get(path: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    global _stale_served
     params_key: Tuple[Tuple[str, Any], ...] = tuple(sorted((params or {}).items()))
-    return _ch_get_cached(path, params_key)
+    try:
+        return _ch_get_cached(path, params_key)
+    except requests.RequestException:
+        # Stale-if-error: an expired copy beats failing the whole search. Done
+        # outside _ch_get_cached so the old copy never enters the memory cache.
+        stale = _disk_get(json.dumps([path, params_key]), None)
+        if stale is None:
+            raise
+        with _STALE_LOCK:
+            _stale_served += 1
+        return stale
 
 
 # ---------------------------------------------------------------------------
@@ -105,35 +310,36 @@ def advanced_search_by_sic(
     size: int = 100,
     start_index: int = 0,
     company_status: str = "active",
+    incorporated_to: Optional[dt.date] = None,
 ) -> Dict[str, Any]:
-    return ch_get(
-        "/advanced-search/companies",
-        {
-            "sic_codes": ",".join(sic_codes),
-            "size": size,
-            "start_index": start_index,
-            "company_status": company_status,
-        },
-    )
+    params: Dict[str, Any] = {
+        "sic_codes": ",".join(sic_codes),
+        "size": size,
+        "start_index": start_index,
+        "company_status": company_status,
+    }
+    if incorporated_to is not None:
+        params["incorporated_to"] = incorporated_to.isoformat()
+    return ch_get("/advanced-search/companies", params)
 
 
 def get_company_profile(company_number: str) -> Dict[str, Any]:
     return ch_get(f"/company/{company_number}")
 
 
-def get_directors(company_number: str) -> List[Dict[str, Any]]:
+def get_directors(company_number: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Active directors. With limit, stops after limit + 1 (enough to tell "too many")."""
     data = ch_get(
         f"/company/{company_number}/officers",
         {"items_per_page": 100, "order_by": "appointed_on"},
     )
-    out: List[Dict[str, Any]] = []
-    for it in data.get("items") or []:
-        if it.get("officer_role") != "director":
-            continue
-        if it.get("resigned_on"):
-            continue
-        out.append({"name": it.get("name"), "dob": it.get("date_of_birth") or {}})
-    return out
+    # Active directors only, filtered and shaped lazily in one pass
+    active = (
+        {"name": it.get("name"), "dob": it.get("date_of_birth") or {}}
+        for it in data.get("items") or ()
+        if it.get("officer_role") == "director" and not it.get("resigned_on")
+    )
+    return list(islice(active, None if limit is None else limit + 1))
 
 
 # ---------------------------------------------------------------------------
@@ -141,11 +347,11 @@ def get_directors(company_number: str) -> List[Dict[str, Any]]:
 # ---------------------------------------------------------------------------
 
 
-def approx_age(dob: Optional[Dict[str, int]]) -> Optional[int]:
+def approx_age(dob: Optional[Dict[str, int]], today: Optional[dt.date] = None) -> Optional[int]:
     if not dob or "year" not in dob:
         return None
     y, m = dob["year"], dob.get("month", 6)
-    t = dt.date.today()
+    t = today or dt.date.today()
     return t.year - y - (t.month < m)
 
 
@@ -155,36 +361,124 @@ def months_between(d1: dt.date, d2: dt.date) -> int:
     return (d2.year - d1.year) * 12 + (d2.month - d1.month) - (1 if d2.day < d1.day else 0)
 
 
+def _parse_date(value: Any) -> Optional[dt.date]:
+    if not value:
+        return None
+    return _parse_iso(str(value)[:10])
+
+
+# Accounts / confirmation dates cluster on a few month-ends, so most lookups are hits
+@lru_cache(maxsize=4096)
+def _parse_iso(s: str) -> Optional[dt.date]:
+    # CH dates are ISO "YYYY-MM-DD"; fromisoformat is a C parser, no split/int per part
+    try:
+        return dt.date.fromisoformat(s)
+    except ValueError:
+        return None
+
+
 # ---------------------------------------------------------------------------
 # Geo / Radius
 # ---------------------------------------------------------------------------
 
 
-@_cache_data(ttl=86400, show_spinner=False)
-def _postcodes_bulk_cached(chunk: Tuple[str, ...]) -> Dict[str, Tuple[Optional[float], Optional[float]]]:
+# Postcode centroids don't move, so successful lookups are kept per postcode with no
+# expiry: in memory for the process, and in the disk cache's postcodes table across
+# restarts. Only postcodes neither has seen go to postcodes.io.
+_POSTCODE_CACHE: Dict[str, Tuple[Optional[float], Optional[float]]] = {}
+_POSTCODE_CHUNK = 100  # postcodes.io bulk endpoint limit
+_POSTCODE_WORKERS = 4
+
+
+class PostcodeLookupError(RuntimeError):
+    """postcodes.io couldn't be reached, so a postcode is unknown rather than invalid."""
+
+
+def _postcodes_bulk_fetch(chunk: List[str]) -> Dict[str, Tuple[Optional[float], Optional[float]]]:
     out: Dict[str, Tuple[Optional[float], Optional[float]]] = {}
     try:
-        r = SESSION.post("https://api.postcodes.io/postcodes", json={"postcodes": list(chunk)}, timeout=30)
+        r = SESSION.post("https://api.postcodes.io/postcodes", json={"postcodes": chunk}, timeout=30)
         if r.status_code == 200:
-            for item in r.json().get("result", []):
+            for item in _json_loads(r.content).get("result", []):
                 q = (item.get("query") or "").strip().upper()
                 res = item.get("result") or {}
                 out[q] = (res.get("latitude"), res.get("longitude")) if res else (None, None)
     except Exception:
-        for q in chunk:
-            out[q] = (None, None)
+        pass  # not cached, so the next call retries
     return out
 
 
-def _bulk_lookup_postcodes(postcodes: List[str]) -> Dict[str, Tuple[Optional[float], Optional[float]]]:
+def _disk_postcodes_get(postcodes: List[str]) -> Dict[str, Tuple[Optional[float], Optional[float]]]:
     out: Dict[str, Tuple[Optional[float], Optional[float]]] = {}
-    uniq = [p for p in sorted({(p or "").strip().upper() for p in postcodes}) if p]
-    for i in range(0, len(uniq), 100):
-        chunk = tuple(uniq[i : i + 100])
-        out.update(_postcodes_bulk_cached(chunk))
+    conn = _db()
+    if conn is None:
+        return out
+    try:
+        with _DB_LOCK:
+            for i in range(0, len(postcodes), 500):  # stay under SQLite's bound-parameter limit
+                part = postcodes[i : i + 500]
+                sql = f"SELECT postcode, lat, lon FROM postcodes WHERE postcode IN ({','.join('?' * len(part))})"
+                for pc, lat, lon in conn.execute(sql, part):
+                    out[pc] = (lat, lon)
+    except sqlite3.Error:
+        pass
     return out
 
 
+def _disk_postcodes_put(found: Dict[str, Tuple[Optional[float], Optional[float]]]) -> None:
+    conn = _db()
+    if conn is None or not found:
+        return
+    try:
+        with _DB_LOCK:
+            conn.executemany(
+                "INSERT OR REPLACE INTO postcodes (postcode, lat, lon) VALUES (?, ?, ?)",
+                [(pc, lat, lon) for pc, (lat, lon) in found.items()],
+            )
+            conn.commit()
+    except sqlite3.Error:
+        pass
+
+
+def _bulk_lookup_postcodes(postcodes: List[str]) -> Dict[str, Tuple[Optional[float], Optional[float]]]:
+    uniq = {(p or "").strip().upper() for p in postcodes}
+    uniq.discard("")
+    misses = sorted(p for p in uniq if p not in _POSTCODE_CACHE)
+    if misses:
+        _POSTCODE_CACHE.update(_disk_postcodes_get(misses))
+        misses = [p for p in misses if p not in _POSTCODE_CACHE]
+    chunks = [misses[i : i + _POSTCODE_CHUNK] for i in range(0, len(misses), _POSTCODE_CHUNK)]
+    if len(chunks) > 1:
+        # postcodes.io isn't rate limited like Companies House, so overlap the round trips
+        with ThreadPoolExecutor(max_workers=min(_POSTCODE_WORKERS, len(chunks))) as pool:
+            results = list(pool.map(_postcodes_bulk_fetch, chunks))
+    else:
+        results = [_postcodes_bulk_fetch(c) for c in chunks]
+    fetched: Dict[str, Tuple[Optional[float], Optional[float]]] = {}
+    for res in results:
+        fetched.update(res)
+    _POSTCODE_CACHE.update(fetched)
+    _disk_postcodes_put(fetched)
+    return {p: _POSTCODE_CACHE[p] for p in uniq if p in _POSTCODE_CACHE}
+
+
+def _centre_latlon(
+    centre: str, latlons: Dict[str, Tuple[Optional[float], Optional[float]]]
+) -> Tuple[Optional[float], Optional[float]]:
+    """Centre from a bulk lookup: (None, None) if postcodes.io doesn't know it."""
+    if centre and centre not in latlons:
+        # The lookup itself failed. Raise rather than return "no rows", so callers'
+        # caches (st.cache_data doesn't store exceptions) don't pin an empty result.
+        raise PostcodeLookupError(f"Couldn't look up centre postcode {centre}")
+    return latlons.get(centre, (None, None))
+
+
+def geocode_postcode(postcode: str) -> Tuple[Optional[float], Optional[float]]:
+    """(lat, lon) for one postcode, (None, None) if invalid; raises PostcodeLookupError."""
+    pc = (postcode or "").strip().upper()
+    return _centre_latlon(pc, _bulk_lookup_postcodes([pc]))
+
+
 def geocode_rows(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     pcs = [(r.get("postcode") or "").strip().upper() for r in rows]
     latlons = _bulk_lookup_postcodes(pcs)
@@ -199,42 +493,64 @@ def geocode_rows(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     return out
 
 
-def _hav(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
-    R = 6371.0
-    p1, p2 = math.radians(lat1), math.radians(lat2)
-    dphi = math.radians(lat2 - lat1)
-    dlmb = math.radians(lon2 - lon1)
-    a = math.sin(dphi / 2) ** 2 + math.cos(p1) * math.cos(p2) * math.sin(dlmb / 2) ** 2
-    return 2 * R * math.asin(math.sqrt(a))
+_EARTH_RADIUS_KM = 6371.0
+_KM_PER_DEG_LAT = 111.0  # slightly under the true ~111.2, so the box errs wide
+
+
+def _hav_a(lat0: float, lon0: float, lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+    """Haversine term a from one point to many (distance = 2R*asin(sqrt(a))); NaN in, NaN out."""
+    p1, p2 = math.radians(lat0), np.radians(lats)
+    dphi = np.radians(lats - lat0)
+    dlmb = np.radians(lons - lon0)
+    return np.sin(dphi / 2) ** 2 + math.cos(p1) * np.cos(p2) * np.sin(dlmb / 2) ** 2
+
+
+def _within_radius(
+    lat0: float,
+    lon0: float,
+    coords: List[Tuple[Optional[float], Optional[float]]],
+    radius_km: float,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Indices of coords within radius_km of the centre, and their distances."""
+    lats = np.array([c[0] for c in coords], dtype=np.float64)  # None -> NaN
+    lons = np.array([c[1] for c in coords], dtype=np.float64)
+
+    # Lat/lon box first (1 deg lat >= 111 km, 1% slack) so the trig only runs on
+    # plausible rows; NaN (ungeocoded) compares False and drops out here.
+    dlat = radius_km / _KM_PER_DEG_LAT * 1.01
+    dlon = dlat / max(0.01, math.cos(math.radians(lat0)))
+    box = np.flatnonzero((np.abs(lats - lat0) <= dlat) & (np.abs(lons - lon0) <= dlon))
+    # Distance rises with a, so test a against the radius's own a and only take
+    # asin/sqrt for the rows that are kept.
+    a = _hav_a(lat0, lon0, lats[box], lons[box])
+    inside = a <= math.sin(radius_km / (2 * _EARTH_RADIUS_KM)) ** 2
+    dist = 2 * _EARTH_RADIUS_KM * np.arcsin(np.sqrt(a[inside]))
+    return box[inside], dist
 
 
 def filter_by_radius(rows: List[Dict[str, Any]], centre_postcode: str, radius_km: float) -> List[Dict[str, Any]]:
     if not rows or not centre_postcode or radius_km <= 0:
         return rows
-    try:
-        r = SESSION.get(f"https://api.postcodes.io/postcodes/{centre_postcode}", timeout=15)
-        res = (r.json().get("result") or {}) if r.status_code == 200 else {}
-        lat0, lon0 = res.get("latitude"), res.get("longitude")
-    except Exception:
-        lat0 = lon0 = None
+    centre = centre_postcode.strip().upper()
+    pcs = [(r.get("postcode") or "").strip().upper() for r in rows]
+    # Centre rides along in the same (cached) bulk lookup as the rows
+    latlons = _bulk_lookup_postcodes([centre] + pcs)
+    lat0, lon0 = _centre_latlon(centre, latlons)
     if lat0 is None or lon0 is None:
         return []
-    pcs = [(r.get("postcode") or "").strip().upper() for r in rows]
-    latlons = _bulk_lookup_postcodes(pcs)
+    coords = [latlons.get(pc, (None, None)) for pc in pcs]
+    keep, dist = _within_radius(lat0, lon0, coords, radius_km)
+
+    # Dicts are only copied for rows inside the radius, nearest first
+    rounded = [round(float(d), 1) for d in dist]
     out: List[Dict[str, Any]] = []
-    for r in rows:
-        pc = (r.get("postcode") or "").strip().upper()
-        lat, lon = latlons.get(pc, (None, None))
-        if lat is None or lon is None:
-            continue
-        dist = _hav(lat0, lon0, lat, lon)
-        if dist <= radius_km:
-            r2 = dict(r)
-            r2["distance_km"] = round(dist, 1)
-            r2["lat"] = lat
-            r2["lon"] = lon
-            out.append(r2)
-    out.sort(key=lambda x: x.get("distance_km", 1e9))
+    for j in np.argsort(rounded, kind="stable"):
+        i = keep[j]
+        r2 = dict(rows[i])
+        r2["distance_km"] = rounded[j]
+        r2["lat"] = coords[i][0]
+        r2["lon"] = coords[i][1]
+        out.append(r2)
     return out
 
 
@@ -243,6 +559,106 @@ def filter_by_radius(rows: List[Dict[str, Any]], centre_postcode: str, radius_km
 # ---------------------------------------------------------------------------
 
 
+def _search_postcode(c: Dict[str, Any]) -> str:
+    ro = c.get("registered_office_address") or {}
+    return (ro.get("postal_code") or ro.get("postcode") or "").strip().upper()
+
+
+def _evaluate_company(
+    c: Dict[str, Any],
+    created: str,
+    years_trading: int,
+    *,
+    min_age: int,
+    max_directors: int,
+    today: dt.date,
+) -> Optional[Dict[str, Any]]:
+    """Fetch directors + profile for one search hit; None if it fails a filter."""
+    cnum = c["company_number"]
+
+    # Directors & ages
+    directors = get_directors(cnum, limit=max_directors)
+    if not directors or len(directors) > max_directors:
+        return None
+    # Stop at the first director who is too young (or has no DOB); past this point
+    # every age is known, so no None filtering is needed below.
+    dir_ages: List[int] = []
+    for d in directors:
+        age = approx_age(d.get("dob"), today)
+        if age is None or age < min_age:
+            return None
+        dir_ages.append(age)
+    avg_dir_age = round(sum(dir_ages) / len(dir_ages), 1)
+
+    # Company profile
+    prof = get_company_profile(cnum)
+    ro = prof.get("registered_office_address") or {}
+    pc = ro.get("postal_code") or ro.get("postcode")
+
+    # Risk flags
+    has_insolvency = bool(prof.get("has_insolvency_history"))
+    undeliverable_ro = bool(prof.get("undeliverable_registered_office_address"))
+    office_in_dispute = bool(prof.get("registered_office_is_in_dispute"))
+
+    if has_insolvency or undeliverable_ro or office_in_dispute:
+        return None
+
+    # Accounts
+    accounts = prof.get("accounts") or {}
+    la = accounts.get("last_accounts") or {}
+    last_made = la.get("made_up_to") or la.get("period_end_on")
+    last_accounts_date = _parse_date(last_made)
+
+    months_since_accounts: Optional[int] = None
+    if last_accounts_date:
+        months_since_accounts = months_between(last_accounts_date, today)
+
+    accounts_overdue = bool(accounts.get("overdue") or (accounts.get("next_accounts") or {}).get("overdue"))
+
+    # Confirmation statement
+    conf = prof.get("confirmation_statement") or {}
+    conf_last = conf.get("last_made_up_to")
+    conf_last_date = _parse_date(conf_last)
+
+    months_since_conf: Optional[int] = None
+    if conf_last_date:
+        months_since_conf = months_between(conf_last_date, today)
+
+    conf_overdue = bool(conf.get("overdue"))
+
+    # Simple freshness rules: ignore badly overdue or missing
+    if accounts_overdue or (months_since_accounts is None) or months_since_accounts > 36:
+        return None
+    if conf_overdue or (months_since_conf is None) or months_since_conf > 36:
+        return None
+
+    ch_link = f"https://find-and-update.company-information.service.gov.uk/company/{cnum}"
+    google = f"https://www.google.com/search?q={quote_plus((c.get('company_name') or '') + ' ' + (pc or ''))}"
+
+    return {
+        "company_number": cnum,
+        "company_name": c.get("company_name"),
+        "incorporated": created,
+        "years_trading": years_trading,
+        "sic_codes": ",".join(c.get("sic_codes", [])),
+        "active_directors": len(directors),
+        "director_ages": ",".join(str(a) for a in dir_ages),
+        "avg_director_age": avg_dir_age,
+        "postcode": pc,
+        "last_accounts_made_up_to": str(last_accounts_date) if last_accounts_date else None,
+        "months_since_accounts": months_since_accounts,
+        "accounts_overdue": accounts_overdue,
+        "confirmation_last_made_up_to": str(conf_last_date) if conf_last_date else None,
+        "months_since_confirmation": months_since_conf,
+        "confirmation_overdue": conf_overdue,
+        "has_insolvency_history": has_insolvency,
+        "undeliverable_registered_office_address": undeliverable_ro,
+        "registered_office_is_in_dispute": office_in_dispute,
+        "ch_link": ch_link,
+        "google": google,
+    }
+
+
 def find_targets(
     sic_codes: List[str],
     *,
@@ -252,6 +668,8 @@ def find_targets(
     size: int = 100,
     start_page: int = 0,
     max_companies: int = 200,
+    centre_postcode: str = "",
+    radius_km: float = 0.0,
 ) -> List[Dict[str, Any]]:
     """
     Return a list of companies that roughly match our retirement-ready profile:
@@ -262,128 +680,91 @@ def find_targets(
     - At least min_years_trading
     - Clean risk flags
     - Accounts & confirmation not badly overdue
+
+    With centre_postcode + radius_km, search hits whose registered-office postcode
+    is known to be outside the radius are dropped before any per-company calls.
+    filter_by_radius is still the final distance check (on the profile postcode).
+    Raises PostcodeLookupError if postcodes.io can't be reached for the centre.
     """
     results: List[Dict[str, Any]] = []
     today = dt.date.today()
 
+    # Companies younger than min_years_trading can never pass, so have CH drop them
+    # server-side; pages then only hold companies old enough to be worth an officers call.
+    incorporated_to: Optional[dt.date] = None
+    if min_years_trading > 0:
+        try:
+            incorporated_to = today.replace(year=today.year - min_years_trading)
+        except ValueError:  # 29 Feb -> non-leap year
+            incorporated_to = today.replace(year=today.year - min_years_trading, day=28)
+
     start_index = start_page * size
-    data = advanced_search_by_sic(sic_codes, size=size, start_index=start_index)
+    data = advanced_search_by_sic(sic_codes, size=size, start_index=start_index, incorporated_to=incorporated_to)
     items = data.get("items") or []
     if not items:
         return results
 
+    candidates: List[Tuple[Dict[str, Any], str, int]] = []
     for c in items:
-        if len(results) >= max_companies:
-            break
-
         cnum = c.get("company_number")
         if not cnum:
             continue
 
         created = c.get("date_of_creation")
-        years_trading: Optional[int] = None
-        if created:
-            try:
-                y, m, d = map(int, created.split("-"))
-                created_date = dt.date(y, m, d)
-                years_trading = today.year - y - ((today.month, today.day) < (m, d))
-            except Exception:
-                years_trading = None
-        if (years_trading is None) or (years_trading < min_years_trading):
+        created_date = _parse_date(created)
+        if created_date is None:
             continue
-
-        # Directors & ages
-        directors = get_directors(cnum)
-        if not directors or len(directors) > max_directors:
-            continue
-        dir_ages = [approx_age(d.get("dob")) for d in directors]
-        if any(a is None or a < min_age for a in dir_ages):
-            continue
-        valid_ages = [a for a in dir_ages if a is not None]
-        avg_dir_age = round(sum(valid_ages) / len(valid_ages), 1) if valid_ages else None
-
-        # Company profile
-        prof = get_company_profile(cnum)
-        ro = prof.get("registered_office_address") or {}
-        pc = ro.get("postal_code") or ro.get("postcode")
-
-        # Risk flags
-        has_insolvency = bool(prof.get("has_insolvency_history"))
-        undeliverable_ro = bool(prof.get("undeliverable_registered_office_address"))
-        office_in_dispute = bool(prof.get("registered_office_is_in_dispute"))
-
-        if has_insolvency or undeliverable_ro or office_in_dispute:
-            continue
-
-        # Accounts
-        accounts = prof.get("accounts") or {}
-        la = accounts.get("last_accounts") or {}
-        last_made = la.get("made_up_to") or la.get("period_end_on")
-        last_accounts_date: Optional[dt.date] = None
-        if last_made:
-            try:
-                y, m, d = map(int, str(last_made).split("-"))
-                last_accounts_date = dt.date(y, m, d)
-            except Exception:
-                pass
-
-        months_since_accounts: Optional[int] = None
-        if last_accounts_date:
-            months_since_accounts = months_between(last_accounts_date, today)
-
-        accounts_overdue = bool(accounts.get("overdue") or (accounts.get("next_accounts") or {}).get("overdue"))
-
-        # Confirmation statement
-        conf = prof.get("confirmation_statement") or {}
-        conf_last = conf.get("last_made_up_to")
-        conf_last_date: Optional[dt.date] = None
-        if conf_last:
-            try:
-                y, m, d = map(int, str(conf_last).split("-"))
-                conf_last_date = dt.date(y, m, d)
-            except Exception:
-                pass
-
-        months_since_conf: Optional[int] = None
-        if conf_last_date:
-            months_since_conf = months_between(conf_last_date, today)
-
-        conf_overdue = bool(conf.get("overdue"))
-
-        # Simple freshness rules: ignore badly overdue or missing
-        if accounts_overdue or (months_since_accounts is None) or months_since_accounts > 36:
-            continue
-        if conf_overdue or (months_since_conf is None) or months_since_conf > 36:
+        years_trading = (
+            today.year - created_date.year - ((today.month, today.day) < (created_date.month, created_date.day))
+        )
+        if years_trading < min_years_trading:
             continue
 
-        ch_link = f"https://find-and-update.company-information.service.gov.uk/company/{cnum}"
-        google = f"https://www.google.com/search?q={quote_plus((c.get('company_name') or '') + ' ' + (pc or ''))}"
-
-        results.append(
-            {
-                "company_number": cnum,
-                "company_name": c.get("company_name"),
-                "incorporated": created,
-                "years_trading": years_trading,
-                "sic_codes": ",".join(c.get("sic_codes", [])),
-                "active_directors": len(directors),
-                "director_ages": ",".join(str(a) for a in dir_ages if a is not None),
-                "avg_director_age": avg_dir_age,
-                "postcode": pc,
-                "last_accounts_made_up_to": str(last_accounts_date) if last_accounts_date else None,
-                "months_since_accounts": months_since_accounts,
-                "accounts_overdue": accounts_overdue,
-                "confirmation_last_made_up_to": str(conf_last_date) if conf_last_date else None,
-                "months_since_confirmation": months_since_conf,
-                "confirmation_overdue": conf_overdue,
-                "has_insolvency_history": has_insolvency,
-                "undeliverable_registered_office_address": undeliverable_ro,
-                "registered_office_is_in_dispute": office_in_dispute,
-                "ch_link": ch_link,
-                "google": google,
-            }
-        )
+        candidates.append((c, created, years_trading))
+
+    if candidates and centre_postcode and radius_km > 0:
+        # One bulk geocode for the centre and every hit's search-payload postcode;
+        # it also warms the postcode cache for the later filter_by_radius call.
+        centre = centre_postcode.strip().upper()
+        pcs = [_search_postcode(c) for c, _, _ in candidates]
+        latlons = _bulk_lookup_postcodes([centre] + pcs)
+        lat0, lon0 = _centre_latlon(centre, latlons)  # raises if the lookup itself failed
+        if lat0 is None or lon0 is None:
+            return results  # unknown postcode: filter_by_radius would drop everything anyway
+        known = [i for i, pc in enumerate(pcs) if latlons.get(pc, (None, None))[0] is not None]
+        near, _ = _within_radius(lat0, lon0, [latlons[pcs[i]] for i in known], radius_km)
+        far = set(known).difference(known[j] for j in near)
+        # Hits without a usable postcode stay in; their profile postcode decides later
+        candidates = [cand for i, cand in enumerate(candidates) if i not in far]
+
+    if not candidates:
+        return results
 
-        time.sleep(0.02)
+    # Each candidate costs a couple of CH calls that mostly wait on the network,
+    # so evaluate them on a small pool; _throttle still enforces the rate limit.
+    pool = ThreadPoolExecutor(max_workers=min(_MAX_WORKERS, len(candidates)))
+    try:
+        futures = [
+            pool.submit(
+                _evaluate_company,
+                c,
+                created,
+                years_trading,
+                min_age=min_age,
+                max_directors=max_directors,
+                today=today,
+            )
+            for c, created, years_trading in candidates
+        ]
+        # Walk in search order so the output (and the max_companies cut) matches the serial loop
+        for fut in futures:
+            row = fut.result()
+            if row is None:
+                continue
+            results.append(row)
+            if len(results) >= max_companies:
+                break
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
 
     return results